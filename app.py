@@ -10,33 +10,50 @@ Description: Production-ready voice AI tool with speech-to-text, text-to-speech,
 
 import os
 import asyncio
-from typing import Optional, Dict, Any, List
+import contextlib
+import hashlib
+import heapq
+import re
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks
+import aiofiles
+
+from fastapi import FastAPI, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, FileResponse
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, StreamingResponse
 from loguru import logger
-import uvicorn
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from src.audio.speech_processor import SpeechProcessor
 from src.ai.conversation_engine import ConversationEngine
-from src.utils.config import Settings
+from src.utils.batching import BatchedRunner
+from src.utils.config import get_settings
 from src.utils.logger import setup_logging
-from src.database.session import get_db_session
+from src.database.models import UsageAnalytics, ConversationLog
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
 from src.api.models import (
     VoiceRequest,
     VoiceResponse,
     ConversationRequest,
-    ConversationResponse,
-    AudioUploadResponse
+    ConversationResponse
 )
 
-# Initialize settings and logging
-settings = Settings()
-setup_logging(settings.LOG_LEVEL)
+# Initialize settings (logging is configured at startup)
+settings = get_settings()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -56,27 +73,90 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses (Brotli when available, with gzip fallback)
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Mount static files
 static_dir = Path("static")
 static_dir.mkdir(exist_ok=True)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Initialize core components
+# Content types accepted for audio uploads, derived from ALLOWED_AUDIO_FORMATS
+AUDIO_CONTENT_TYPE_ALIASES = {
+    "wav": ("audio/x-wav", "audio/wave"),
+    "mp3": ("audio/mpeg",),
+    "m4a": ("audio/mp4", "audio/x-m4a"),
+    "flac": ("audio/x-flac",),
+    "aac": ("audio/x-aac",),
+}
+ALLOWED_AUDIO_CONTENT_TYPES = frozenset(
+    content_type
+    for fmt in settings.ALLOWED_AUDIO_FORMATS
+    for content_type in (f"audio/{fmt}", *AUDIO_CONTENT_TYPE_ALIASES.get(fmt, ()))
+)
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Analytics rows are buffered and written to the database in batches
+ANALYTICS_QUEUE_SIZE = 10_000
+ANALYTICS_BATCH_SIZE = 512
+ANALYTICS_FLUSH_INTERVAL = 0.2  # seconds
+
+# Generated audio files are deleted this long after being served
+TEMP_FILE_TTL = 300  # seconds
+
+# Media types for synthesized audio, keyed by file extension
+AUDIO_MEDIA_TYPES = {".wav": "audio/wav", ".ogg": "audio/ogg"}
+
+# Streamed replies are synthesized per sentence; HTTP streams send 20ms PCM16 frames
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+STREAM_FRAME_MS = 20
+
+# WebSocket frames carry a 1-byte tag: JSON metadata or PCM16 audio
+WS_TEXT_TAG = b"\x00"
+WS_AUDIO_TAG = b"\x01"
+
+# Initialize core components. Constructors only store settings; models are
+# loaded in startup_event so a preloaded (gunicorn --preload) master stays
+# light and each forked worker initializes its own device context.
 speech_processor = SpeechProcessor(settings)
 conversation_engine = ConversationEngine(settings)
 
+# Dynamic batching of concurrent model calls, started when ENABLE_DYNAMIC_BATCHING is set
+batch_runners: Dict[str, BatchedRunner] = {}
+
+# In-process caches: voice -> TTS conditioning, upload digest -> (expiry, transcription)
+_voice_conditioning_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_transcription_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize application components on startup."""
+    setup_logging(settings.LOG_LEVEL)
     logger.info("Starting Voice-GenAI-Tool application...")
     
-    # Initialize database
+    # Initialize database and the batched analytics writer
     await init_database()
+    if settings.ENABLE_ANALYTICS:
+        app.state.analytics_queue = asyncio.Queue(maxsize=ANALYTICS_QUEUE_SIZE)
+        app.state.analytics_task = asyncio.create_task(_analytics_writer())
+    
+    # Single worker that deletes expired temporary files
+    app.state.cleanup_heap = []
+    app.state.cleanup_event = asyncio.Event()
+    app.state.cleanup_task = asyncio.create_task(_cleanup_worker())
     
     # Initialize AI models
     await conversation_engine.initialize()
     await speech_processor.initialize()
     
+    if settings.ENABLE_DYNAMIC_BATCHING:
+        start_batch_runners()
+    
     logger.info("Application startup completed successfully")
 
 @app.on_event("shutdown")
@@ -84,15 +164,78 @@ async def shutdown_event():
     """Cleanup on application shutdown."""
     logger.info("Shutting down Voice-GenAI-Tool application...")
     
+    for runner in batch_runners.values():
+        await runner.stop()
+    batch_runners.clear()
+    
     await conversation_engine.cleanup()
     await speech_processor.cleanup()
     
+    # Flush pending analytics rows before closing the connection pool
+    if settings.ENABLE_ANALYTICS:
+        await app.state.analytics_queue.put(None)
+        await app.state.analytics_task
+    await app.state.db_engine.dispose()
+    
+    # Remove temporary files that are still pending cleanup
+    app.state.cleanup_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.state.cleanup_task
+    while app.state.cleanup_heap:
+        _, file_path = heapq.heappop(app.state.cleanup_heap)
+        _remove_temp_file(file_path)
+    
     logger.info("Application shutdown completed")
 
+def start_batch_runners():
+    """Create and start a batch runner for each model call."""
+    batch_functions = {
+        "transcription": _batch_function(
+            speech_processor, "transcribe_batch", speech_processor.transcribe_audio, unpack=False
+        ),
+        "synthesis": _batch_function(
+            speech_processor, "synthesize_batch", speech_processor.synthesize_speech
+        ),
+        "conversation": _batch_function(
+            conversation_engine, "process_conversation_batch", conversation_engine.process_conversation
+        ),
+    }
+    for name, batch_fn in batch_functions.items():
+        runner = BatchedRunner(batch_fn, settings.BATCH_MAX_SIZE, settings.BATCH_MAX_WAIT_MS)
+        runner.start()
+        batch_runners[name] = runner
+
+def _batch_function(backend: Any, batch_method: str, single_fn, unpack: bool = True):
+    """Use the backend's batch method, or run single-item calls concurrently.
+    
+    Args:
+        backend: Speech processor or conversation engine
+        batch_method: Name of the optional batched method on the backend
+        single_fn: Single-item coroutine function used as the fallback
+        unpack: Pass each item as keyword arguments instead of positionally
+    """
+    batch_fn = getattr(backend, batch_method, None)
+    if batch_fn is not None:
+        return batch_fn
+    
+    async def run_each(items: List[Any]) -> List[Any]:
+        calls = (single_fn(**item) if unpack else single_fn(item) for item in items)
+        return await asyncio.gather(*calls, return_exceptions=True)
+    
+    return run_each
+
 async def init_database():
-    """Initialize database connection and tables."""
+    """Initialize the shared database engine and verify the connection."""
     try:
-        async with get_db_session() as session:
+        engine_options = {"pool_pre_ping": True}
+        if not settings.DATABASE_URL.startswith("sqlite"):
+            engine_options["pool_size"] = settings.DATABASE_POOL_SIZE
+            engine_options["max_overflow"] = settings.DATABASE_MAX_OVERFLOW
+        
+        app.state.db_engine = create_async_engine(settings.DATABASE_URL, **engine_options)
+        app.state.db_session = async_sessionmaker(app.state.db_engine, expire_on_commit=False)
+        
+        async with app.state.db_engine.connect():
             logger.info("Database connection established")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
@@ -111,18 +254,29 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    speech_status, conversation_status = await asyncio.gather(
+        speech_processor.health_check(),
+        conversation_engine.health_check(),
+        return_exceptions=True
+    )
+    
     return {
         "status": "healthy",
-        "timestamp": asyncio.get_event_loop().time(),
+        "timestamp": time.time(),
         "services": {
-            "speech_processor": await speech_processor.health_check(),
-            "conversation_engine": await conversation_engine.health_check()
+            "speech_processor": _service_status(speech_status),
+            "conversation_engine": _service_status(conversation_status)
         }
     }
 
+def _service_status(result: Any) -> Any:
+    """Convert a failed sub-check into an unhealthy status entry."""
+    if isinstance(result, Exception):
+        return {"status": "unhealthy", "error": str(result)}
+    return result
+
 @app.post("/api/v1/speech-to-text", response_model=VoiceResponse)
 async def speech_to_text(
-    background_tasks: BackgroundTasks,
     audio_file: UploadFile = File(..., description="Audio file for transcription")
 ):
     """Convert speech to text using advanced ASR models."""
@@ -130,16 +284,15 @@ async def speech_to_text(
         logger.info(f"Processing speech-to-text request: {audio_file.filename}")
         
         # Validate audio file
-        if not audio_file.content_type.startswith('audio/'):
+        if _media_type(audio_file.content_type) not in ALLOWED_AUDIO_CONTENT_TYPES:
             raise HTTPException(status_code=400, detail="Invalid audio file format")
         
         # Process audio file
-        result = await speech_processor.transcribe_audio(audio_file)
+        result = await _transcribe_upload(audio_file)
         
-        # Add background task for analytics
-        background_tasks.add_task(
-            log_usage_analytics, 
-            "speech-to-text", 
+        # Queue usage analytics
+        log_usage_analytics(
+            "speech-to-text",
             audio_file.filename,
             result.get("confidence", 0)
         )
@@ -151,34 +304,36 @@ async def speech_to_text(
             language=result.get("language", "auto-detected")
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Speech-to-text processing failed: {e}")
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
 @app.post("/api/v1/text-to-speech", response_class=FileResponse)
-async def text_to_speech(
-    request: VoiceRequest,
-    background_tasks: BackgroundTasks
-):
+async def text_to_speech(request: VoiceRequest):
     """Convert text to speech using advanced TTS models."""
     try:
         logger.info(f"Processing text-to-speech request: {request.text[:50]}...")
         
         # Generate speech from text
-        audio_file_path = await speech_processor.synthesize_speech(
+        voice = request.voice or "default"
+        audio_file_path = await _synthesize(
             text=request.text,
-            voice=request.voice or "default",
+            voice=voice,
             language=request.language or "en",
             speed=request.speed or 1.0
         )
         
-        # Add background task for cleanup
-        background_tasks.add_task(cleanup_temp_file, audio_file_path)
+        # Schedule cleanup
+        schedule_temp_file_cleanup(audio_file_path)
         
+        suffix = Path(audio_file_path).suffix
         return FileResponse(
             path=audio_file_path,
-            media_type="audio/wav",
-            filename=f"speech_{asyncio.get_event_loop().time()}.wav"
+            media_type=AUDIO_MEDIA_TYPES.get(suffix, "application/octet-stream"),
+            filename=f"speech_{time.monotonic_ns()}{suffix}",
+            headers={"Content-Encoding": "identity"}  # Audio gains little from gzip/brotli; keep the compression middleware off it
         )
         
     except Exception as e:
@@ -186,25 +341,21 @@ async def text_to_speech(
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
 @app.post("/api/v1/conversation", response_model=ConversationResponse)
-async def ai_conversation(
-    request: ConversationRequest,
-    background_tasks: BackgroundTasks
-):
+async def ai_conversation(request: ConversationRequest):
     """Process AI-powered conversation with context awareness."""
     try:
         logger.info(f"Processing conversation request: {request.message[:50]}...")
         
         # Process conversation with AI engine
-        response = await conversation_engine.process_conversation(
+        response = await _run_conversation(
             message=request.message,
             context=request.context,
             user_id=request.user_id,
             conversation_id=request.conversation_id
         )
         
-        # Add background task for conversation logging
-        background_tasks.add_task(
-            log_conversation,
+        # Queue conversation logging
+        log_conversation(
             request.user_id,
             request.message,
             response["response"]
@@ -224,7 +375,6 @@ async def ai_conversation(
 
 @app.post("/api/v1/voice-conversation")
 async def voice_conversation(
-    background_tasks: BackgroundTasks,
     audio_file: UploadFile = File(..., description="Voice message for AI conversation")
 ):
     """End-to-end voice conversation: speech-to-text, AI processing, text-to-speech."""
@@ -232,24 +382,24 @@ async def voice_conversation(
         logger.info(f"Processing voice conversation: {audio_file.filename}")
         
         # Step 1: Speech to Text
-        transcription = await speech_processor.transcribe_audio(audio_file)
+        transcription = await _transcribe_upload(audio_file)
         
         # Step 2: AI Conversation
-        conversation_response = await conversation_engine.process_conversation(
+        conversation_response = await _run_conversation(
             message=transcription["text"],
             context={},
             user_id="voice_user"
         )
         
         # Step 3: Text to Speech
-        audio_response_path = await speech_processor.synthesize_speech(
+        audio_response_path = await _synthesize(
             text=conversation_response["response"],
             voice="default",
             language="en"
         )
         
-        # Add cleanup background task
-        background_tasks.add_task(cleanup_temp_file, audio_response_path)
+        # Schedule cleanup
+        schedule_temp_file_cleanup(audio_response_path)
         
         return {
             "transcription": transcription["text"],
@@ -265,47 +415,397 @@ async def voice_conversation(
         logger.error(f"Voice conversation processing failed: {e}")
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
+@app.post("/api/v1/voice-conversation/stream")
+async def voice_conversation_stream(
+    audio_file: UploadFile = File(..., description="Voice message for AI conversation")
+):
+    """Streaming voice conversation: reply audio is returned while it is generated."""
+    try:
+        logger.info(f"Processing streaming voice conversation: {audio_file.filename}")
+        audio_path, _ = await _spool_upload(audio_file)
+    except Exception as e:
+        logger.error(f"Streaming voice conversation failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
+    
+    return StreamingResponse(
+        _stream_voice_reply(audio_path),
+        media_type="audio/wav",
+        headers={"Content-Encoding": "identity"}  # Keep compression middleware from buffering frames
+    )
+
+@app.websocket("/ws/voice")
+async def voice_websocket(websocket: WebSocket):
+    """Voice conversation over a persistent WebSocket.
+    
+    The client sends binary audio frames followed by a {"type": "end"} text
+    frame. The server replies with tagged frames: JSON metadata (transcript,
+    reply sentences, end of turn) and one PCM16 audio frame per synthesized
+    sentence.
+    """
+    await websocket.accept()
+    
+    async def send_metadata(payload: Dict[str, Any]):
+        await websocket.send_bytes(WS_TEXT_TAG + orjson.dumps(payload))
+    
+    async def on_transcript(text: str):
+        await send_metadata({"type": "transcript", "text": text})
+    
+    await send_metadata({"type": "ready", "sample_rate": settings.SAMPLE_RATE, "encoding": "pcm_s16le"})
+    
+    try:
+        while True:
+            async for sentence, pcm in _voice_reply_audio(_receive_audio(websocket), on_transcript):
+                await send_metadata({"type": "sentence", "text": sentence})
+                await websocket.send_bytes(WS_AUDIO_TAG + pcm)
+            
+            await send_metadata({"type": "end"})
+    except WebSocketDisconnect:
+        logger.info("Voice WebSocket disconnected")
+    except Exception as e:
+        logger.error(f"Voice WebSocket failed: {e}")
+        await websocket.close(code=1011)
+
 @app.get("/api/v1/models")
 async def list_available_models():
     """List all available AI and speech models."""
+    speech_models, ai_models, voices = await asyncio.gather(
+        speech_processor.list_models(),
+        conversation_engine.list_models(),
+        speech_processor.list_voices()
+    )
+    
     return {
-        "speech_models": await speech_processor.list_models(),
-        "ai_models": await conversation_engine.list_models(),
-        "voices": await speech_processor.list_voices()
+        "speech_models": speech_models,
+        "ai_models": ai_models,
+        "voices": voices
     }
 
 @app.get("/api/v1/stats")
 async def get_usage_statistics():
     """Get usage statistics and analytics."""
     try:
-        async with get_db_session() as session:
+        async with app.state.db_session() as session:
             stats = await get_analytics_data(session)
             return stats
     except Exception as e:
         logger.error(f"Failed to fetch statistics: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch statistics")
 
-# Background task functions
-async def log_usage_analytics(service: str, filename: str, confidence: float):
-    """Log usage analytics to database."""
+# Upload helpers
+def _media_type(content_type: Optional[str]) -> str:
+    """Media type of an upload without parameters, e.g. 'audio/webm;codecs=opus' -> 'audio/webm'."""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+async def _spool_upload(audio_file: UploadFile) -> Tuple[Path, str]:
+    """Stream an uploaded file to a temporary file on disk.
+    
+    Returns:
+        Tuple of the temporary file path and the BLAKE2b digest of its contents
+    """
+    suffix = Path(audio_file.filename or "").suffix
+    fd, temp_path = tempfile.mkstemp(dir=settings.UPLOAD_DIR, suffix=suffix)
+    os.close(fd)
+    digest = hashlib.blake2b()
+    
     try:
-        async with get_db_session() as session:
-            await save_analytics(session, service, filename, confidence)
+        async with aiofiles.open(temp_path, "wb") as f:
+            while chunk := await audio_file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await f.write(chunk)
+    except Exception:
+        os.remove(temp_path)
+        raise
+    
+    return Path(temp_path), digest.hexdigest()
+
+async def _transcribe_upload(audio_file: UploadFile) -> Dict[str, Any]:
+    """Transcribe an upload, reusing the result for byte-identical audio."""
+    audio_path, digest = await _spool_upload(audio_file)
+    try:
+        now = time.monotonic()
+        cached = _transcription_cache.get(digest)
+        if cached is not None and cached[0] > now:
+            _transcription_cache.move_to_end(digest)
+            return cached[1]
+        
+        result = await _run_transcription(audio_path)
+        
+        _transcription_cache[digest] = (now + settings.TRANSCRIPTION_CACHE_TTL, result)
+        _transcription_cache.move_to_end(digest)
+        while len(_transcription_cache) > settings.TRANSCRIPTION_CACHE_SIZE:
+            _transcription_cache.popitem(last=False)
+        return result
+    finally:
+        audio_path.unlink(missing_ok=True)
+
+async def _get_voice_conditioning(voice: str) -> Dict[str, Any]:
+    """Get the TTS conditioning (reference mel + speaker embedding) for a voice.
+    
+    The reference audio is only encoded the first time a voice is used.
+    """
+    conditioning = _voice_conditioning_cache.get(voice)
+    if conditioning is not None:
+        _voice_conditioning_cache.move_to_end(voice)
+        return conditioning
+    
+    conditioning = await speech_processor.prepare_voice(voice)
+    _voice_conditioning_cache[voice] = conditioning
+    while len(_voice_conditioning_cache) > settings.VOICE_CACHE_SIZE:
+        _voice_conditioning_cache.popitem(last=False)
+    return conditioning
+
+# Model calls, routed through the batch runners when batching is enabled
+async def _run_transcription(audio_path: Path) -> Dict[str, Any]:
+    """Transcribe an audio file."""
+    runner = batch_runners.get("transcription")
+    if runner is not None:
+        return await runner.submit(audio_path)
+    return await speech_processor.transcribe_audio(audio_path)
+
+async def _run_synthesis(**kwargs) -> str:
+    """Synthesize speech and return the audio file path."""
+    runner = batch_runners.get("synthesis")
+    if runner is not None:
+        return await runner.submit(kwargs)
+    return await speech_processor.synthesize_speech(**kwargs)
+
+async def _run_conversation(**kwargs) -> Dict[str, Any]:
+    """Generate a conversation response."""
+    runner = batch_runners.get("conversation")
+    if runner is not None:
+        return await runner.submit(kwargs)
+    return await conversation_engine.process_conversation(**kwargs)
+
+# Synthesis helpers
+async def _synthesize(text: str, voice: str, language: str, **kwargs) -> str:
+    """Synthesize speech and encode it in the configured output format."""
+    audio_path = await _run_synthesis(
+        text=text,
+        voice=voice,
+        language=language,
+        conditioning=await _get_voice_conditioning(voice),
+        **kwargs
+    )
+    
+    if settings.AUDIO_FORMAT == "ogg":
+        audio_path = await _encode_opus(audio_path)
+    return audio_path
+
+async def _encode_opus(wav_path: str) -> str:
+    """Transcode a WAV file to Ogg/Opus with ffmpeg, replacing the original.
+    
+    The WAV is removed whether or not encoding succeeds, and a partially
+    written Ogg file is removed when it fails.
+    """
+    ogg_path = str(Path(wav_path).with_suffix(".ogg"))
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-i", wav_path,
+            "-c:a", "libopus", "-b:a", settings.OPUS_BITRATE,
+            ogg_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"Opus encoding failed: {stderr.decode().strip()}")
+    except BaseException:
+        _remove_temp_file(ogg_path)
+        raise
+    finally:
+        _remove_temp_file(wav_path)
+    
+    return ogg_path
+
+# Streaming pipeline helpers
+async def _stream_voice_reply(audio_path: Path) -> AsyncIterator[bytes]:
+    """Yield a streamed WAV reply for an uploaded voice message."""
+    frame_size = settings.SAMPLE_RATE * 2 * STREAM_FRAME_MS // 1000
+    
+    try:
+        yield _wav_stream_header(settings.SAMPLE_RATE)
+        async for _, pcm in _voice_reply_audio(audio_path):
+            for offset in range(0, len(pcm), frame_size):
+                yield pcm[offset:offset + frame_size]
     except Exception as e:
-        logger.error(f"Analytics logging failed: {e}")
+        logger.error(f"Streaming voice conversation failed: {e}")
+    finally:
+        audio_path.unlink(missing_ok=True)
+
+async def _voice_reply_audio(audio, on_transcript=None) -> AsyncIterator[Tuple[str, bytes]]:
+    """Run STT -> LLM -> TTS as overlapping stages, yielding (sentence, PCM16) pairs.
+    
+    Transcript partials feed the LLM directly, and each completed sentence of
+    the reply is synthesized while the LLM keeps generating the next one.
+    
+    Args:
+        audio: Audio file path or async iterator of audio chunks
+        on_transcript: Optional coroutine function called with each transcript partial
+    """
+    sentences: asyncio.Queue = asyncio.Queue()
+    
+    async def transcript_stream():
+        async for partial in speech_processor.stream_transcribe(audio):
+            if on_transcript is not None:
+                await on_transcript(partial)
+            yield partial
+    
+    async def produce_sentences():
+        try:
+            tokens = conversation_engine.stream_process_conversation(
+                message_stream=transcript_stream(),
+                context={},
+                user_id="voice_user"
+            )
+            async for sentence in _split_sentences(tokens):
+                await sentences.put(sentence)
+        finally:
+            sentences.put_nowait(None)
+    
+    producer = asyncio.create_task(produce_sentences())
+    
+    try:
+        conditioning = await _get_voice_conditioning("default")
+        while (sentence := await sentences.get()) is not None:
+            pcm = await speech_processor.synthesize_speech_chunk(
+                text=sentence,
+                voice="default",
+                language="en",
+                conditioning=conditioning
+            )
+            yield sentence, pcm
+        
+        await producer  # Surface STT/LLM errors
+    finally:
+        producer.cancel()
+
+async def _receive_audio(websocket: WebSocket) -> AsyncIterator[bytes]:
+    """Yield binary audio frames from a WebSocket until an end-of-turn text frame."""
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        
+        if message.get("bytes") is not None:
+            yield message["bytes"]
+        elif orjson.loads(message["text"]).get("type") == "end":
+            return
 
-async def log_conversation(user_id: str, input_message: str, response: str):
-    """Log conversation to database for analytics."""
+async def _split_sentences(tokens: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Group a stream of text tokens into sentences."""
+    buffer = ""
+    async for token in tokens:
+        buffer += token
+        *sentences, buffer = SENTENCE_BOUNDARY.split(buffer)
+        for sentence in sentences:
+            yield sentence
+    
+    if buffer.strip():
+        yield buffer.strip()
+
+def _wav_stream_header(sample_rate: int, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """Build a WAV header for PCM data of unknown length."""
+    block_align = channels * bits_per_sample // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 0xFFFFFFFF, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits_per_sample,
+        b"data", 0xFFFFFFFF
+    )
+
+# Analytics functions. Rows are inserted into the UsageAnalytics and
+# ConversationLog tables of src.database.models, which are expected to have
+# these columns:
+#   UsageAnalytics: service, filename, confidence, created_at
+#   ConversationLog: user_id, input_message, response, created_at
+def log_usage_analytics(service: str, filename: str, confidence: float):
+    """Queue a usage analytics row for the batched database writer."""
+    _queue_analytics_row(UsageAnalytics, {
+        "service": service,
+        "filename": filename,
+        "confidence": confidence,
+        "created_at": datetime.now(timezone.utc)
+    })
+
+def log_conversation(user_id: str, input_message: str, response: str):
+    """Queue a conversation log row for the batched database writer."""
+    _queue_analytics_row(ConversationLog, {
+        "user_id": user_id,
+        "input_message": input_message,
+        "response": response,
+        "created_at": datetime.now(timezone.utc)
+    })
+
+def _queue_analytics_row(table, row: Dict[str, Any]):
+    """Add a row to the analytics queue, dropping it if the queue is full."""
+    if not settings.ENABLE_ANALYTICS:
+        return
+    
     try:
-        async with get_db_session() as session:
-            await save_conversation_log(session, user_id, input_message, response)
+        app.state.analytics_queue.put_nowait((table, row))
+    except asyncio.QueueFull:
+        logger.warning(f"Analytics queue full, dropping {table.__name__} row")
+
+async def _analytics_writer():
+    """Drain the analytics queue, inserting rows in batches until a None sentinel arrives."""
+    queue = app.state.analytics_queue
+    running = True
+    
+    while running:
+        batch = [await queue.get()]
+        await asyncio.sleep(ANALYTICS_FLUSH_INTERVAL)  # Let a batch accumulate
+        while len(batch) < ANALYTICS_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        
+        rows_by_table = {}
+        for item in batch:
+            if item is None:
+                running = False
+                continue
+            table, row = item
+            rows_by_table.setdefault(table, []).append(row)
+        
+        if rows_by_table:
+            await _write_analytics_batch(rows_by_table)
+
+async def _write_analytics_batch(rows_by_table: Dict[Any, List[Dict[str, Any]]]):
+    """Insert buffered analytics rows with one executemany per table."""
+    try:
+        async with app.state.db_session() as session:
+            for table, rows in rows_by_table.items():
+                await session.execute(insert(table), rows)
+            await session.commit()
     except Exception as e:
-        logger.error(f"Conversation logging failed: {e}")
+        logger.error(f"Analytics logging failed: {e}")
 
-async def cleanup_temp_file(file_path: str):
-    """Clean up temporary files after use."""
+# Temporary file cleanup
+def schedule_temp_file_cleanup(file_path: str):
+    """Schedule a temporary file for deletion after TEMP_FILE_TTL seconds."""
+    heapq.heappush(app.state.cleanup_heap, (time.monotonic() + TEMP_FILE_TTL, file_path))
+    app.state.cleanup_event.set()
+
+async def _cleanup_worker():
+    """Delete temporary files as they expire, sleeping until the earliest expiry."""
+    heap = app.state.cleanup_heap
+    event = app.state.cleanup_event
+    
+    while True:
+        if not heap:
+            event.clear()
+            await event.wait()
+        
+        # TTL is fixed, so entries pushed while sleeping never expire earlier
+        await asyncio.sleep(max(0.0, heap[0][0] - time.monotonic()))
+        
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            _, file_path = heapq.heappop(heap)
+            _remove_temp_file(file_path)
+
+def _remove_temp_file(file_path: str):
+    """Clean up a temporary file after use."""
     try:
-        await asyncio.sleep(300)  # Wait 5 minutes before cleanup
         if os.path.exists(file_path):
             os.remove(file_path)
             logger.info(f"Cleaned up temporary file: {file_path}")
@@ -313,6 +813,8 @@ async def cleanup_temp_file(file_path: str):
         logger.error(f"File cleanup failed: {e}")
 
 if __name__ == "__main__":
+    import uvicorn
+    
     uvicorn.run(
         "app:app",
         host=settings.HOST,
@@ -320,5 +822,10 @@ if __name__ == "__main__":
         reload=settings.DEBUG,
         workers=settings.WORKERS if not settings.DEBUG else 1,
         log_config=None,  # Use custom logging
-        access_log=False  # Disable default access log
+        access_log=False,  # Disable default access log
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
+        interface="asgi3",
+        limit_concurrency=settings.MAX_CONCURRENT_REQUESTS * 4,
+        timeout_keep_alive=30
     )
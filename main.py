@@ -17,6 +17,7 @@ import sys
 import os
 import asyncio
 import argparse
+import importlib.util
 from pathlib import Path
 
 # Add src directory to Python path
@@ -26,8 +27,7 @@ if src_path.exists():
     sys.path.insert(0, str(src_path))
 
 try:
-    import uvicorn
-    from app import app
+    from app import app, settings
     from utils.logger import get_logger
     from utils.config import load_config
 except ImportError as e:
@@ -38,6 +38,18 @@ except ImportError as e:
 # Initialize logger
 logger = get_logger(__name__)
 
+def default_event_loop() -> str:
+    """Use uvloop when it is installed (it does not support Windows)."""
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+        return "uvloop"
+    return "asyncio"
+
+def default_http_protocol() -> str:
+    """Use the C-based httptools parser when it is installed."""
+    if importlib.util.find_spec("httptools") is not None:
+        return "httptools"
+    return "h11"
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -66,6 +78,32 @@ def parse_arguments():
         default=1,
         help="Number of worker processes (default: 1)"
     )
+    parser.add_argument(
+        "--loop",
+        type=str,
+        default=default_event_loop(),
+        choices=["auto", "asyncio", "uvloop"],
+        help="Event loop implementation (default: uvloop if installed)"
+    )
+    parser.add_argument(
+        "--http",
+        type=str,
+        default=default_http_protocol(),
+        choices=["auto", "h11", "httptools"],
+        help="HTTP protocol implementation (default: httptools if installed)"
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=settings.MAX_CONCURRENT_REQUESTS * 4,
+        help="Maximum concurrent connections before returning 503"
+    )
+    parser.add_argument(
+        "--timeout-keep-alive",
+        type=int,
+        default=30,
+        help="Seconds to keep idle keep-alive connections open (default: 30)"
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -166,6 +204,11 @@ def main():
             "port": args.port,
             "log_level": args.log_level,
             "access_log": True,
+            "loop": args.loop,
+            "http": args.http,
+            "interface": "asgi3",
+            "limit_concurrency": args.limit_concurrency,
+            "timeout_keep_alive": args.timeout_keep_alive,
         }
         
         if args.reload:
@@ -176,7 +219,8 @@ def main():
             if args.workers > 1:
                 logger.info(f"Starting with {args.workers} worker processes")
         
-        # Run the server
+        # Run the server (uvicorn is only imported when actually serving)
+        import uvicorn
         uvicorn.run(**uvicorn_config)
         
     except KeyboardInterrupt:
@@ -13,6 +13,7 @@ Author: VinodHatti7019
 Version: 1.0.0
 """
 
+from types import MappingProxyType
 from typing import Dict, Any
 import logging
 
@@ -28,8 +29,8 @@ __description__ = "API module for Voice GenAI Tool - Provides RESTful endpoints
 # Initialize logger for the API module
 logger = logging.getLogger(__name__)
 
-# API configuration constants
-API_CONFIG = {
+# API configuration constants (read-only)
+API_CONFIG = MappingProxyType({
     "version": __version__,
     "title": "Voice GenAI Tool API",
     "description": __description__,
@@ -41,16 +42,16 @@ API_CONFIG = {
         "name": "MIT",
         "url": "https://opensource.org/licenses/MIT",
     },
-}
+})
 
-# API endpoint prefixes
-API_PREFIXES = {
+# API endpoint prefixes (read-only)
+API_PREFIXES = MappingProxyType({
     "speech": "/api/v1/speech",
     "tts": "/api/v1/tts",
     "conversation": "/api/v1/conversation",
     "health": "/api/v1/health",
     "websocket": "/ws",
-}
+})
 
 # Supported audio formats
 SUPPORTED_AUDIO_FORMATS = {
@@ -79,7 +80,7 @@ def get_api_info() -> Dict[str, Any]:
         "api_version": __version__,
         "title": API_CONFIG["title"],
         "description": API_CONFIG["description"],
-        "endpoints": API_PREFIXES,
+        "endpoints": dict(API_PREFIXES),
         "supported_formats": SUPPORTED_AUDIO_FORMATS,
         "settings": DEFAULT_SETTINGS,
         "contact": API_CONFIG["contact"],
@@ -119,11 +120,12 @@ def get_endpoint_url(endpoint_type: str, base_url: str = "") -> str:
     prefix = API_PREFIXES[endpoint_type]
     return f"{base_url.rstrip('/')}{prefix}" if base_url else prefix
 
-# Log module initialization
-logger.info(f"Voice GenAI Tool API module initialized (v{__version__})")
-logger.info(f"Available endpoints: {list(API_PREFIXES.keys())}")
-logger.info(f"Supported input formats: {SUPPORTED_AUDIO_FORMATS['input']}")
-logger.info(f"Supported output formats: {SUPPORTED_AUDIO_FORMATS['output']}")
+# Log module initialization (skips message formatting unless debugging)
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug(f"Voice GenAI Tool API module initialized (v{__version__})")
+    logger.debug(f"Available endpoints: {list(API_PREFIXES.keys())}")
+    logger.debug(f"Supported input formats: {SUPPORTED_AUDIO_FORMATS['input']}")
+    logger.debug(f"Supported output formats: {SUPPORTED_AUDIO_FORMATS['output']}")
 
 # Export main components
 __all__ = [
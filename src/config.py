@@ -5,14 +5,16 @@ for the backend API, including CORS, logging, and service settings.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-from pydantic import BaseSettings, validator
+from typing import Optional, Tuple
+from typing_extensions import Annotated  # typing.Annotated needs Python 3.9
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-env_path = Path('.') / '.env'
-load_dotenv(dotenv_path=env_path)
+# Comma-separated environment value, e.g. CORS_ORIGINS=http://a,http://b
+CommaSeparated = Annotated[Tuple[str, ...], NoDecode]
 
 
 class Settings(BaseSettings):
@@ -30,13 +32,10 @@ class Settings(BaseSettings):
     debug: bool = os.getenv('DEBUG', 'True').lower() == 'true'
     
     # CORS Configuration
-    cors_origins: List[str] = [
-        origin.strip() 
-        for origin in os.getenv('CORS_ORIGINS', 'http://localhost:80,http://localhost:3000').split(',')
-    ]
+    cors_origins: CommaSeparated = ('http://localhost:80', 'http://localhost:3000')
     allow_credentials: bool = os.getenv('ALLOW_CREDENTIALS', 'True').lower() == 'true'
-    allow_methods: List[str] = os.getenv('ALLOW_METHODS', '*').split(',')
-    allow_headers: List[str] = os.getenv('ALLOW_HEADERS', '*').split(',')
+    allow_methods: CommaSeparated = ('*',)
+    allow_headers: CommaSeparated = ('*',)
     
     # Logging
     log_level: str = os.getenv('LOG_LEVEL', 'info').upper()
@@ -54,10 +53,7 @@ class Settings(BaseSettings):
     
     # Language Support
     default_language: str = os.getenv('DEFAULT_LANGUAGE', 'en')
-    supported_languages: List[str] = [
-        lang.strip()
-        for lang in os.getenv('SUPPORTED_LANGUAGES', 'en,es,fr,de,hi,zh,ja,ar,ru,pt').split(',')
-    ]
+    supported_languages: CommaSeparated = ('en', 'es', 'fr', 'de', 'hi', 'zh', 'ja', 'ar', 'ru', 'pt')
     
     # Performance Settings
     max_concurrent_requests: int = int(os.getenv('MAX_CONCURRENT_REQUESTS', '10'))
@@ -80,7 +76,16 @@ class Settings(BaseSettings):
     rate_limit_enabled: bool = os.getenv('RATE_LIMIT_ENABLED', 'True').lower() == 'true'
     rate_limit_per_minute: int = int(os.getenv('RATE_LIMIT_PER_MINUTE', '60'))
     
-    @validator('model_dir', 'data_dir', 'cache_dir')
+    @field_validator('cors_origins', 'allow_methods', 'allow_headers', 'supported_languages', mode='before')
+    @classmethod
+    def split_comma_separated(cls, v):
+        """Parse comma-separated values from environment variables."""
+        if isinstance(v, str):
+            return tuple(item.strip() for item in v.split(','))
+        return v
+    
+    @field_validator('model_dir', 'data_dir', 'cache_dir')
+    @classmethod
     def create_directories(cls, v: Path) -> Path:
         """Ensure directories exist."""
         v.mkdir(parents=True, exist_ok=True)
@@ -96,24 +101,26 @@ class Settings(BaseSettings):
         """Check if running in development environment."""
         return self.environment.lower() == 'development'
     
-    class Config:
-        """Pydantic configuration."""
-        case_sensitive = False
-        env_file = '.env'
-        env_file_encoding = 'utf-8'
-
-
-# Global settings instance
-settings = Settings()
+    model_config = SettingsConfigDict(
+        case_sensitive=False,
+        env_file='.env',
+        env_file_encoding='utf-8',
+        extra='ignore',
+    )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings.
     
+    The .env file is loaded and the settings are built once per process;
+    later calls return the same instance.
+    
     Returns:
         Settings: Application configuration settings
     """
-    return settings
+    load_dotenv(dotenv_path=Path('.') / '.env')
+    return Settings()
 
 
 def get_cors_config() -> dict:
@@ -122,6 +129,7 @@ def get_cors_config() -> dict:
     Returns:
         dict: CORS configuration dictionary
     """
+    settings = get_settings()
     return {
         'allow_origins': settings.cors_origins,
         'allow_credentials': settings.allow_credentials,
@@ -12,10 +12,11 @@ Author: VinodHatti7019
 Version: 1.0.0
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, Tuple
 import logging
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # Package metadata
 __version__ = "1.0.0"
@@ -25,8 +26,16 @@ __description__ = "Core AI/ML modules for voice processing in Voice GenAI Tool"
 # Initialize logger for the modules package
 logger = logging.getLogger(__name__)
 
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
 # Module configuration constants
-MODULE_CONFIG = {
+MODULE_CONFIG = _freeze({
     "version": __version__,
     "supported_models": {
         "asr": ["whisper-tiny", "whisper-base", "whisper-small", "whisper-medium", "whisper-large-v3"],
@@ -50,46 +59,88 @@ MODULE_CONFIG = {
         "buffer_size": 4096,
         "max_audio_length": 300,  # seconds
     }
-}
+})
+
+# Lookup tables derived from MODULE_CONFIG
+_LANGS = frozenset(lang.lower() for lang in MODULE_CONFIG["supported_languages"])
+_MODEL_TYPES = MODULE_CONFIG["supported_models"]
+
+_CPU_COUNT = os.cpu_count() or 1
 
 # Module paths and directories
-MODULE_PATHS = {
+MODULE_PATHS = MappingProxyType({
     "models_dir": Path("models"),
     "cache_dir": Path("cache"),
     "temp_dir": Path("temp"),
     "audio_dir": Path("audio"),
     "logs_dir": Path("logs"),
-}
+})
+_MODULE_PATHS_STR = MappingProxyType({k: str(v) for k, v in MODULE_PATHS.items()})
+_directories_ready = False  # Set once every module directory exists
 
 # Performance settings
-PERFORMACE_CONFIG = {
+PERFORMANCE_CONFIG = MappingProxyType({
     "use_gpu": True,
     "gpu_memory_fraction": 0.8,
-    "num_threads": os.cpu_count(),
+    "num_threads": _CPU_COUNT,
     "batch_size": 1,
     "streaming_chunk_size": 1024,
     "realtime_factor": 1.0,
+})
+
+# Default configurations per module type, merged once at import
+_BASE_CONFIG = {**MODULE_CONFIG["default_settings"], **PERFORMANCE_CONFIG}
+_DEFAULT_CONFIGS = {
+    "asr": {
+        **_BASE_CONFIG,
+        "model_name": "whisper-base",
+        "language": "auto",
+        "task": "transcribe",
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": 0.0,
+    },
+    "tts": {
+        **_BASE_CONFIG,
+        "model_name": "elevenlabs",
+        "voice_id": "default",
+        "stability": 0.75,
+        "similarity_boost": 0.75,
+        "style": 0.0,
+        "use_speaker_boost": True,
+    },
+    "voice_cloning": {
+        **_BASE_CONFIG,
+        "model_name": "elevenlabs-clone",
+        "similarity_threshold": 0.8,
+        "quality": "high",
+        "preserve_accent": True,
+    },
 }
 
-def get_module_info() -> Dict[str, Any]:
+# Module information is static, so it is assembled once
+_MODULE_INFO = MappingProxyType({
+    "version": __version__,
+    "description": __description__,
+    "author": __author__,
+    "supported_models": MODULE_CONFIG["supported_models"],
+    "supported_languages": MODULE_CONFIG["supported_languages"],
+    "audio_formats": MODULE_CONFIG["audio_formats"],
+    "sample_rates": MODULE_CONFIG["sample_rates"],
+    "default_settings": MODULE_CONFIG["default_settings"],
+    "performance_config": PERFORMANCE_CONFIG,
+    "module_paths": _MODULE_PATHS_STR
+})
+
+def get_module_info() -> Mapping[str, Any]:
     """
     Get comprehensive module information.
     
     Returns:
-        Dict containing module version, supported models, and configuration
+        Read-only mapping of module version, supported models, and configuration
     """
-    return {
-        "version": __version__,
-        "description": __description__,
-        "author": __author__,
-        "supported_models": MODULE_CONFIG["supported_models"],
-        "supported_languages": MODULE_CONFIG["supported_languages"],
-        "audio_formats": MODULE_CONFIG["audio_formats"],
-        "sample_rates": MODULE_CONFIG["sample_rates"],
-        "default_settings": MODULE_CONFIG["default_settings"],
-        "performance_config": PERFORME_CONFIG,
-        "module_paths": {k: str(v) for k, v in MODULE_PATHS.items()}
-    }
+    setup_module_directories()
+    return _MODULE_INFO
 
 def validate_audio_config(config: Dict[str, Any]) -> bool:
     """
@@ -130,34 +181,43 @@ def setup_module_directories() -> bool:
     """
     Create necessary directories for module operation.
     
+    Succeeds at most once per process; a failed attempt is retried on the
+    next call. It is called lazily by the functions that need the
+    directories rather than at import time.
+    
     Returns:
         True if directories were created successfully, False otherwise
     """
-    try:
-        for dir_name, dir_path in MODULE_PATHS.items():
-            if not dir_path.exists():
-                dir_path.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Created directory: {dir_path}")
+    global _directories_ready
+    if _directories_ready:
         return True
-    except Exception as e:
+    
+    try:
+        for dir_path in set(MODULE_PATHS.values()):
+            dir_path.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
         logger.error(f"Failed to create module directories: {e}")
         return False
+    
+    _directories_ready = True
+    return True
 
-def get_available_models(model_type: str) -> List[str]:
+def get_available_models(model_type: str) -> Tuple[str, ...]:
     """
-    Get list of available models for a specific type.
+    Get available models for a specific type.
     
     Args:
         model_type: Type of model ('asr', 'tts', 'voice_cloning')
     
     Returns:
-        List of available model names
+        Tuple of available model names
     """
-    if model_type not in MODULE_CONFIG["supported_models"]:
+    models = _MODEL_TYPES.get(model_type)
+    if models is None:
         logger.warning(f"Unknown model type: {model_type}")
-        return []
+        return ()
     
-    return MODULE_CONFIG["supported_models"][model_type]
+    return models
 
 def validate_language_support(language: str) -> bool:
     """
@@ -169,7 +229,7 @@ def validate_language_support(language: str) -> bool:
     Returns:
         True if language is supported, False otherwise
     """
-    return language.lower() in MODULE_CONFIG["supported_languages"]
+    return language.lower() in _LANGS
 
 def get_default_config(module_type: str) -> Dict[str, Any]:
     """
@@ -181,47 +241,24 @@ def get_default_config(module_type: str) -> Dict[str, Any]:
     Returns:
         Default configuration dictionary
     """
-    base_config = MODULE_CONFIG["default_settings"].copy()
-    base_config.update(PERFORME_CONFIG)
-    
-    # Module-specific settings
-    if module_type == "asr":
-        base_config.update({
-            "model_name": "whisper-base",
-            "language": "auto",
-            "task": "transcribe",
-            "beam_size": 5,
-            "best_of": 5,
-            "temperature": 0.0,
-        })
-    elif module_type == "tts":
-        base_config.update({
-            "model_name": "elevenlabs",
-            "voice_id": "default",
-            "stability": 0.75,
-            "similarity_boost": 0.75,
-            "style": 0.0,
-            "use_speaker_boost": True,
-        })
-    elif module_type == "voice_cloning":
-        base_config.update({
-            "model_name": "elevenlabs-clone",
-            "similarity_threshold": 0.8,
-            "quality": "high",
-            "preserve_accent": True,
-        })
-    
-    return base_config
-
-# Initialize module directories on import
-setup_module_directories()
-
-# Log module initialization
-logger.info(f"Voice GenAI Tool modules package initialized (v{__version__})")
-logger.info(f"Supported ASR models: {MODULE_CONFIG['supported_models']['asr']}")
-logger.info(f"Supported TTS models: {MODULE_CONFIG['supported_models']['tts']}")
-logger.info(f"Supported languages: {len(MODULE_CONFIG['supported_languages'])} languages")
-logger.info(f"Module directories: {list(MODULE_PATHS.keys())}")
+    setup_module_directories()
+    return dict(_DEFAULT_CONFIGS.get(module_type, _BASE_CONFIG))
+
+# Log module initialization as a single structured record
+logger.info(
+    "Voice GenAI Tool modules package initialized (v%s): %d ASR models, "
+    "%d TTS models, %d languages",
+    __version__,
+    len(MODULE_CONFIG["supported_models"]["asr"]),
+    len(MODULE_CONFIG["supported_models"]["tts"]),
+    len(_LANGS),
+    extra={
+        "modules_init": True,
+        "asr_models": MODULE_CONFIG["supported_models"]["asr"],
+        "tts_models": MODULE_CONFIG["supported_models"]["tts"],
+        "module_dirs": tuple(MODULE_PATHS),
+    }
+)
 
 # Export main components
 __all__ = [
@@ -230,7 +267,7 @@ __all__ = [
     "__description__",
     "MODULE_CONFIG",
     "MODULE_PATHS",
-    "PERFORME_CONFIG",
+    "PERFORMANCE_CONFIG",
     "get_module_info",
     "validate_audio_config",
     "setup_module_directories",
@@ -0,0 +1,118 @@
+"""
+Dynamic Request Batching for Voice-GenAI-Tool
+
+Author: Vinod Hatti
+Version: 1.0.0
+Description: Coalesces concurrent inference requests into batched model calls
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+BatchFunction = Callable[[List[Any]], Awaitable[List[Any]]]
+
+class BatchedRunner:
+    """Collect concurrent requests and run them through one batched call.
+
+    Requests are grouped until either ``max_batch`` items are waiting or
+    ``max_wait_ms`` has passed since the first one arrived. ``processor_fn``
+    receives the list of items and must return one result per item, in order;
+    an exception instance in place of a result fails only that item. Batches
+    run concurrently, so a slow batch does not hold up the next one.
+    """
+
+    def __init__(self, processor_fn: BatchFunction, max_batch: int = 8, max_wait_ms: float = 15):
+        self.processor_fn = processor_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._has_items: Optional[asyncio.Event] = None
+        self._batch_full: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    def start(self):
+        """Start the batching worker on the running event loop."""
+        self._has_items = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the worker and fail any requests that were not processed."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        inflight = list(self._inflight)
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+
+        pending, self._pending = self._pending, []
+        self._fail(pending, RuntimeError("Batched runner stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item for the next batch and wait for its result."""
+        if self._worker is None:
+            raise RuntimeError("Batched runner is not started")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+        self._has_items.set()
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+        return await future
+
+    async def _run(self):
+        """Worker loop: wait for a full batch or the deadline, then dispatch it."""
+        while True:
+            await self._has_items.wait()
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), self.max_wait)
+            except asyncio.TimeoutError:
+                pass
+
+            batch = self._pending[:self.max_batch]
+            self._pending = self._pending[self.max_batch:]
+            if len(self._pending) < self.max_batch:
+                self._batch_full.clear()
+            if not self._pending:
+                self._has_items.clear()
+
+            task = asyncio.create_task(self._process(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _process(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run one batch and resolve each request's future."""
+        try:
+            results = await self.processor_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch function returned {len(results)} results for {len(batch)} items"
+                )
+        except asyncio.CancelledError:
+            self._fail(batch, RuntimeError("Batched runner stopped"))
+            raise
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: List[Tuple[Any, asyncio.Future]], error: BaseException):
+        """Propagate an error to every unresolved request in a batch."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
@@ -7,13 +7,31 @@ Description: Comprehensive configuration management using Pydantic settings
 """
 
 import os
-from typing import List, Optional
-from pydantic import BaseSettings, Field, validator
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple
+from typing_extensions import Annotated  # typing.Annotated needs Python 3.9
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from pathlib import Path
+from .fs_init import _ensure_dirs
+
+# Deployment environment, read once at import
+_ENV = os.getenv('ENVIRONMENT', 'development').lower()
+
+# Comma-separated environment value, e.g. ALLOWED_ORIGINS=http://a,http://b
+CommaSeparated = Annotated[Tuple[str, ...], NoDecode]
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        frozen=True,
+        extra="ignore"
+    )
+    
     # Application Settings
     APP_NAME: str = Field(default="Voice-GenAI-Tool", description="Application name")
     VERSION: str = Field(default="1.0.0", description="Application version")
@@ -28,8 +46,8 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, description="Token expiration time")
     
     # CORS Settings
-    ALLOWED_ORIGINS: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080", "https://localhost:3000"],
+    ALLOWED_ORIGINS: CommaSeparated = Field(
+        default=("http://localhost:3000", "http://localhost:8080", "https://localhost:3000"),
         description="Allowed CORS origins"
     )
     
@@ -78,7 +96,8 @@ class Settings(BaseSettings):
     TTS_ENGINE: str = Field(default="gtts", description="TTS engine (gtts, azure, google)")
     DEFAULT_VOICE: str = Field(default="en-US-JennyNeural", description="Default voice")
     SPEECH_SPEED: float = Field(default=1.0, description="Speech speed multiplier")
-    AUDIO_FORMAT: str = Field(default="wav", description="Audio output format")
+    AUDIO_FORMAT: str = Field(default="wav", description="Audio output format (wav, or ogg for Opus)")
+    OPUS_BITRATE: str = Field(default="24k", description="Opus bitrate when AUDIO_FORMAT is ogg")
     SAMPLE_RATE: int = Field(default=22050, description="Audio sample rate")
     
     # File Storage Settings
@@ -86,8 +105,8 @@ class Settings(BaseSettings):
     OUTPUT_DIR: str = Field(default="outputs", description="Output directory")
     TEMP_DIR: str = Field(default="temp", description="Temporary files directory")
     MAX_FILE_SIZE: int = Field(default=50 * 1024 * 1024, description="Max file size in bytes (50MB)")
-    ALLOWED_AUDIO_FORMATS: List[str] = Field(
-        default=["wav", "mp3", "m4a", "flac", "aac", "ogg"],
+    ALLOWED_AUDIO_FORMATS: CommaSeparated = Field(
+        default=("wav", "mp3", "m4a", "flac", "aac", "ogg", "webm"),
         description="Allowed audio file formats"
     )
     
@@ -101,6 +120,9 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_REQUESTS: int = Field(default=100, description="Max concurrent requests")
     REQUEST_TIMEOUT: int = Field(default=300, description="Request timeout in seconds")
     AUDIO_PROCESSING_TIMEOUT: int = Field(default=120, description="Audio processing timeout")
+    VOICE_CACHE_SIZE: int = Field(default=64, description="Max cached voice conditionings")
+    TRANSCRIPTION_CACHE_SIZE: int = Field(default=1024, description="Max cached transcriptions")
+    TRANSCRIPTION_CACHE_TTL: int = Field(default=300, description="Transcription cache TTL in seconds")
     
     # Monitoring Settings
     ENABLE_METRICS: bool = Field(default=True, description="Enable Prometheus metrics")
@@ -111,6 +133,9 @@ class Settings(BaseSettings):
     ENABLE_VOICE_CLONING: bool = Field(default=False, description="Enable voice cloning feature")
     ENABLE_REAL_TIME_PROCESSING: bool = Field(default=True, description="Enable real-time processing")
     ENABLE_BATCH_PROCESSING: bool = Field(default=True, description="Enable batch processing")
+    ENABLE_DYNAMIC_BATCHING: bool = Field(default=False, description="Coalesce concurrent model calls into batches")
+    BATCH_MAX_SIZE: int = Field(default=8, description="Max requests per batched model call")
+    BATCH_MAX_WAIT_MS: float = Field(default=15, description="Max wait to fill a batch in milliseconds")
     ENABLE_ANALYTICS: bool = Field(default=True, description="Enable usage analytics")
     
     # Rate Limiting
@@ -121,46 +146,42 @@ class Settings(BaseSettings):
     WS_MAX_CONNECTIONS: int = Field(default=100, description="Max WebSocket connections")
     WS_HEARTBEAT_INTERVAL: int = Field(default=30, description="WebSocket heartbeat interval")
     
-    @validator('ALLOWED_ORIGINS', pre=True)
+    @field_validator('ALLOWED_ORIGINS', mode='before')
+    @classmethod
     def parse_origins(cls, v):
         """Parse CORS origins from environment variable."""
         if isinstance(v, str):
-            return [origin.strip() for origin in v.split(',')]
+            return tuple(map(str.strip, v.split(',')))
         return v
     
-    @validator('ALLOWED_AUDIO_FORMATS', pre=True)
+    @field_validator('ALLOWED_AUDIO_FORMATS', mode='before')
+    @classmethod
     def parse_audio_formats(cls, v):
         """Parse allowed audio formats from environment variable."""
         if isinstance(v, str):
-            return [format.strip() for format in v.split(',')]
-        return v
-    
-    @validator('UPLOAD_DIR', 'OUTPUT_DIR', 'TEMP_DIR')
-    def create_directories(cls, v):
-        """Create directories if they don't exist."""
-        Path(v).mkdir(parents=True, exist_ok=True)
-        return v
-    
-    @validator('LOG_FILE')
-    def create_log_directory(cls, v):
-        """Create log directory if it doesn't exist."""
-        log_path = Path(v)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+            return tuple(map(str.strip, v.split(',')))
         return v
     
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        validate_assignment = True
+    def runtime_directories(self) -> FrozenSet[Path]:
+        """Directories the application writes to."""
+        return frozenset((
+            Path(self.UPLOAD_DIR),
+            Path(self.OUTPUT_DIR),
+            Path(self.TEMP_DIR),
+            Path(self.LOG_FILE).parent,
+        ))
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance, built on first use."""
+    settings = Settings()
+    _ensure_dirs(settings.runtime_directories())
+    return settings
 
 # Configuration validation
-def validate_configuration():
+def validate_configuration(settings: Optional[Settings] = None):
     """Validate critical configuration settings."""
+    settings = settings or get_settings()
     errors = []
     
     # Check required API keys for production
@@ -210,9 +231,10 @@ class TestingConfig(Settings):
     LOG_LEVEL: str = "WARNING"
 
 # Configuration factory
+@lru_cache(maxsize=4)
 def get_config(environment: str = None) -> Settings:
-    """Get configuration based on environment."""
-    environment = environment or os.getenv('ENVIRONMENT', 'development').lower()
+    """Get configuration based on environment, built once per environment."""
+    environment = environment or _ENV
     
     config_mapping = {
         'development': DevelopmentConfig,
@@ -222,8 +244,9 @@ def get_config(environment: str = None) -> Settings:
     
     config_class = config_mapping.get(environment, Settings)
     config = config_class()
+    _ensure_dirs(config.runtime_directories())
     
     # Validate configuration
-    validate_configuration()
+    validate_configuration(config)
     
     return config
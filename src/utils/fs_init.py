@@ -0,0 +1,17 @@
+"""
+Filesystem Initialization for Voice-GenAI-Tool
+
+Author: Vinod Hatti
+Version: 1.0.0
+Description: Creates the runtime directories required by the configuration
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet
+
+@lru_cache(maxsize=None)
+def _ensure_dirs(paths: FrozenSet[Path]) -> None:
+    """Create each directory once; repeated calls with the same set are free."""
+    for path in paths:
+        path.mkdir(parents=True, exist_ok=True)
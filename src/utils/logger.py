@@ -8,11 +8,22 @@ Description: Production-ready logging setup with Loguru and structured logging
 
 import os
 import sys
+import time
+from functools import wraps
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
-from datetime import datetime
-import json
+from datetime import datetime, timedelta
+
+# Write buffer for structured (JSON) log files; errors stay line-buffered
+JSON_LOG_BUFFER_SIZE = 1 << 20  # 1MB
+
+# Records from this logger are routed to the performance log file
+perf_logger = logger.bind(performance=True)
+
+def _is_performance_record(record) -> bool:
+    """Filter for the performance log sink."""
+    return record["extra"].get("performance", False)
 
 def setup_logging(
     log_level: str = "INFO",
@@ -22,6 +33,7 @@ def setup_logging(
     enable_json: bool = False
 ) -> None:
     """Setup comprehensive logging configuration."""
+    import orjson  # Only the JSON formatter needs it
     
     # Remove default logger
     logger.remove()
@@ -29,6 +41,8 @@ def setup_logging(
     # Create logs directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
+    error_log_path = log_path.with_name(f"{log_path.stem}_error{log_path.suffix}")
+    performance_log_path = log_path.with_name(f"{log_path.stem}_performance{log_path.suffix}")
     
     # Console logging format
     console_format = (
@@ -48,7 +62,12 @@ def setup_logging(
     
     # JSON format for structured logging
     def json_formatter(record):
-        """Format log records as JSON."""
+        """Format log records as JSON.
+        
+        Loguru treats the returned value as a format template, so the
+        serialized record is stored in extra and referenced from there.
+        """
+        extra = record["extra"]
         log_record = {
             "timestamp": record["time"].isoformat(),
             "level": record["level"].name,
@@ -59,12 +78,16 @@ def setup_logging(
         }
         
         # Add extra fields if present
-        if record["extra"]:
-            log_record.update(record["extra"])
-            
-        return json.dumps(log_record)
+        if extra:
+            log_record = {**log_record, **extra}
+            log_record.pop("serialized", None)  # Set by another JSON sink for this record
+        
+        extra["serialized"] = orjson.dumps(
+            log_record, default=str, option=orjson.OPT_NAIVE_UTC
+        ).decode()
+        return "{extra[serialized]}\n"
     
-    # Console handler
+    # Console handler (written directly; stderr needs no background queue)
     logger.add(
         sys.stderr,
         format=console_format,
@@ -72,7 +95,7 @@ def setup_logging(
         colorize=True,
         backtrace=True,
         diagnose=True,
-        enqueue=True
+        enqueue=False
     )
     
     # File handler (standard format)
@@ -85,211 +108,232 @@ def setup_logging(
         compression="zip",
         backtrace=True,
         diagnose=True,
-        enqueue=True
+        enqueue=True,
+        buffering=JSON_LOG_BUFFER_SIZE if enable_json else 1
     )
     
-    # Separate error log file
-    error_log_file = log_file.replace(".log", "_error.log")
-    logger.add(
-        error_log_file,
-        format=file_format if not enable_json else json_formatter,
-        level="ERROR",
-        rotation=log_rotation,
-        retention=log_retention,
-        compression="zip",
-        backtrace=True,
-        diagnose=True,
-        enqueue=True
-    )
-    
-    # Performance log file for metrics
-    performance_log_file = log_file.replace(".log", "_performance.log")
-    logger.add(
-        performance_log_file,
-        format=json_formatter,
-        level="INFO",
-        rotation="1 day",
-        retention="7 days",
-        compression="zip",
-        filter=lambda record: "performance" in record["extra"],
-        enqueue=True
-    )
+    # Error and performance files are production aids; debug runs skip them
+    if log_level.upper() != "DEBUG":
+        # Separate error log file
+        logger.add(
+            error_log_path,
+            format=file_format if not enable_json else json_formatter,
+            level="ERROR",
+            rotation=log_rotation,
+            retention=log_retention,
+            compression="zip",
+            backtrace=True,
+            diagnose=True,
+            enqueue=True
+        )
+        
+        # Performance log file for metrics
+        logger.add(
+            performance_log_path,
+            format=json_formatter,
+            level="INFO",
+            rotation="1 day",
+            retention="7 days",
+            compression="zip",
+            filter=_is_performance_record,
+            enqueue=True,
+            buffering=JSON_LOG_BUFFER_SIZE
+        )
     
     logger.info(f"Logging initialized - Level: {log_level}, File: {log_file}")
 
 class PerformanceLogger:
     """Logger for performance metrics and timing."""
     
+    __slots__ = ("operation_name", "start_time", "metadata")
+    
     def __init__(self, operation_name: str):
         self.operation_name = operation_name
         self.start_time = None
-        self.metadata = {}
+        self.metadata = None
     
     def __enter__(self):
-        self.start_time = datetime.utcnow()
-        logger.info(f"Starting operation: {self.operation_name}", performance=True)
+        self.start_time = time.perf_counter_ns()
+        perf_logger.info(f"Starting operation: {self.operation_name}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = (time.perf_counter_ns() - self.start_time) / 1e9
         end_time = datetime.utcnow()
-        duration = (end_time - self.start_time).total_seconds()
         
         log_data = {
-            "performance": True,
             "operation": self.operation_name,
             "duration_seconds": duration,
-            "start_time": self.start_time.isoformat(),
+            "start_time": (end_time - timedelta(seconds=duration)).isoformat(),
             "end_time": end_time.isoformat(),
             "success": exc_type is None,
-            **self.metadata
         }
+        if self.metadata:
+            log_data.update(self.metadata)
         
         if exc_type:
             log_data["error_type"] = exc_type.__name__
             log_data["error_message"] = str(exc_val)
         
-        logger.info(
+        perf_logger.info(
             f"Operation {self.operation_name} completed in {duration:.3f}s",
             **log_data
         )
     
     def add_metadata(self, **kwargs):
         """Add metadata to the performance log."""
+        if self.metadata is None:
+            self.metadata = {}
         self.metadata.update(kwargs)
 
+# Loggers with the record-type flag bound once, instead of per call
+_api_request_logger = logger.bind(api_request=True)
+_api_response_logger = logger.bind(api_response=True)
+_api_error_logger = logger.bind(api_error=True)
+_audio_upload_logger = perf_logger.bind(audio_upload=True)
+_transcription_logger = perf_logger.bind(transcription=True)
+_synthesis_logger = perf_logger.bind(synthesis=True)
+_model_request_logger = logger.bind(ai_model_request=True)
+_model_response_logger = logger.bind(ai_model_response=True)
+
+def log_api_request(request_id: str, method: str, path: str, params: Dict = None):
+    """Log API request details."""
+    _api_request_logger.info(
+        "API Request: {method} {path}",
+        request_id=request_id,
+        method=method,
+        path=path,
+        params=params or {}
+    )
+
+def log_api_response(
+    request_id: str, 
+    status_code: int, 
+    duration: float,
+    response_size: Optional[int] = None
+):
+    """Log API response details."""
+    _api_response_logger.info(
+        "API Response: {status_code} ({duration:.3f}s)",
+        request_id=request_id,
+        status_code=status_code,
+        duration=duration,
+        response_size=response_size
+    )
+
+def log_api_error(request_id: str, error: Exception, context: Dict = None):
+    """Log API error details."""
+    _api_error_logger.error(
+        "API Error: {error_type}: {error_message}",
+        request_id=request_id,
+        error_type=type(error).__name__,
+        error_message=str(error),
+        context=context or {}
+    )
+
+def log_audio_upload(filename: str, file_size: int, content_type: str):
+    """Log audio file upload."""
+    _audio_upload_logger.info(
+        "Audio uploaded: {filename} ({file_size} bytes)",
+        filename=filename,
+        file_size=file_size,
+        content_type=content_type
+    )
+
+def log_transcription(
+    filename: str, 
+    duration: float, 
+    text_length: int,
+    confidence: float,
+    model_used: str
+):
+    """Log speech-to-text transcription."""
+    _transcription_logger.info(
+        "Transcription completed: {filename} -> {text_length} chars",
+        filename=filename,
+        audio_duration=duration,
+        text_length=text_length,
+        confidence=confidence,
+        model_used=model_used
+    )
+
+def log_synthesis(
+    text_length: int,
+    audio_duration: float,
+    voice: str,
+    language: str
+):
+    """Log text-to-speech synthesis."""
+    _synthesis_logger.info(
+        "Speech synthesis: {text_length} chars -> {audio_duration:.2f}s audio",
+        text_length=text_length,
+        audio_duration=audio_duration,
+        voice=voice,
+        language=language
+    )
+
+def log_model_request(
+    model_name: str,
+    input_tokens: int,
+    parameters: Dict[str, Any]
+):
+    """Log AI model request."""
+    _model_request_logger.info(
+        "AI Model Request: {model_name} ({input_tokens} tokens)",
+        model_name=model_name,
+        input_tokens=input_tokens,
+        parameters=parameters
+    )
+
+def log_model_response(
+    model_name: str,
+    output_tokens: int,
+    duration: float,
+    cost: Optional[float] = None
+):
+    """Log AI model response."""
+    _model_response_logger.info(
+        "AI Model Response: {model_name} -> {output_tokens} tokens ({duration:.3f}s)",
+        model_name=model_name,
+        output_tokens=output_tokens,
+        duration=duration,
+        cost=cost
+    )
+
+# Backward-compatible namespaces for the functions above
 class APILogger:
     """Logger for API requests and responses."""
-    
-    @staticmethod
-    def log_request(request_id: str, method: str, path: str, params: Dict = None):
-        """Log API request details."""
-        logger.info(
-            f"API Request: {method} {path}",
-            api_request=True,
-            request_id=request_id,
-            method=method,
-            path=path,
-            params=params or {}
-        )
-    
-    @staticmethod
-    def log_response(
-        request_id: str, 
-        status_code: int, 
-        duration: float,
-        response_size: Optional[int] = None
-    ):
-        """Log API response details."""
-        logger.info(
-            f"API Response: {status_code} ({duration:.3f}s)",
-            api_response=True,
-            request_id=request_id,
-            status_code=status_code,
-            duration=duration,
-            response_size=response_size
-        )
-    
-    @staticmethod
-    def log_error(request_id: str, error: Exception, context: Dict = None):
-        """Log API error details."""
-        logger.error(
-            f"API Error: {type(error).__name__}: {str(error)}",
-            api_error=True,
-            request_id=request_id,
-            error_type=type(error).__name__,
-            error_message=str(error),
-            context=context or {}
-        )
+    log_request = staticmethod(log_api_request)
+    log_response = staticmethod(log_api_response)
+    log_error = staticmethod(log_api_error)
 
 class AudioProcessingLogger:
     """Specialized logger for audio processing operations."""
-    
-    @staticmethod
-    def log_audio_upload(filename: str, file_size: int, content_type: str):
-        """Log audio file upload."""
-        logger.info(
-            f"Audio uploaded: {filename} ({file_size} bytes)",
-            audio_upload=True,
-            filename=filename,
-            file_size=file_size,
-            content_type=content_type
-        )
-    
-    @staticmethod
-    def log_transcription(
-        filename: str, 
-        duration: float, 
-        text_length: int,
-        confidence: float,
-        model_used: str
-    ):
-        """Log speech-to-text transcription."""
-        logger.info(
-            f"Transcription completed: {filename} -> {text_length} chars",
-            transcription=True,
-            filename=filename,
-            audio_duration=duration,
-            text_length=text_length,
-            confidence=confidence,
-            model_used=model_used
-        )
-    
-    @staticmethod
-    def log_synthesis(
-        text_length: int,
-        audio_duration: float,
-        voice: str,
-        language: str
-    ):
-        """Log text-to-speech synthesis."""
-        logger.info(
-            f"Speech synthesis: {text_length} chars -> {audio_duration:.2f}s audio",
-            synthesis=True,
-            text_length=text_length,
-            audio_duration=audio_duration,
-            voice=voice,
-            language=language
-        )
+    log_audio_upload = staticmethod(log_audio_upload)
+    log_transcription = staticmethod(log_transcription)
+    log_synthesis = staticmethod(log_synthesis)
 
 class AIModelLogger:
     """Logger for AI model interactions."""
-    
-    @staticmethod
-    def log_model_request(
-        model_name: str,
-        input_tokens: int,
-        parameters: Dict[str, Any]
-    ):
-        """Log AI model request."""
-        logger.info(
-            f"AI Model Request: {model_name} ({input_tokens} tokens)",
-            ai_model_request=True,
-            model_name=model_name,
-            input_tokens=input_tokens,
-            parameters=parameters
-        )
-    
-    @staticmethod
-    def log_model_response(
-        model_name: str,
-        output_tokens: int,
-        duration: float,
-        cost: Optional[float] = None
-    ):
-        """Log AI model response."""
-        logger.info(
-            f"AI Model Response: {model_name} -> {output_tokens} tokens ({duration:.3f}s)",
-            ai_model_response=True,
-            model_name=model_name,
-            output_tokens=output_tokens,
-            duration=duration,
-            cost=cost
-        )
+    log_model_request = staticmethod(log_model_request)
+    log_model_response = staticmethod(log_model_response)
 
 # Convenience functions for common logging patterns
+def _level_enabled(level: str) -> bool:
+    """Check whether any configured handler accepts records at this level."""
+    return logger.level(level).no >= logger._core.min_level
+
 def log_performance(operation_name: str):
-    """Decorator for performance logging."""
+    """Decorator for performance logging.
+    
+    If no handler accepts INFO records when the function is decorated, the
+    function is returned unwrapped.
+    """
     def decorator(func):
+        if not _level_enabled("INFO"):
+            return func
+        
+        @wraps(func)
         def wrapper(*args, **kwargs):
             with PerformanceLogger(operation_name) as perf:
                 perf.add_metadata(function_name=func.__name__)
@@ -298,8 +342,16 @@ def log_performance(operation_name: str):
     return decorator
 
 def log_errors(operation_name: str):
-    """Decorator for error logging."""
+    """Decorator for error logging.
+    
+    If no handler accepts ERROR records when the function is decorated, the
+    function is returned unwrapped.
+    """
     def decorator(func):
+        if not _level_enabled("ERROR"):
+            return func
+        
+        @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
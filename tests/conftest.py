@@ -0,0 +1,189 @@
+"""Shared pytest fixtures for Voice-GenAI-Tool.
+
+External service clients are replaced by pre-configured mocks built once
+per session, so tests do not rebuild mock trees or patch modules that may
+not be installed.
+"""
+import asyncio
+import importlib.util
+import json
+import sys
+import types
+import wave
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+from pydantic import BaseModel
+from unittest.mock import Mock
+from fastapi.testclient import TestClient
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Canned backend output used by the app-level tests
+TRANSCRIPT = "hello there"
+REPLY_TOKENS = ("Hi there. ", "How can I help?")
+SENTENCE_PCM = b"\x00\x01" * 2000  # Longer than one 20ms streaming frame
+
+class FakeSpeechProcessor:
+    """Speech backend returning canned transcriptions and audio."""
+    
+    def __init__(self, output_dir: Path, sample_rate: int):
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.transcriptions = 0
+    
+    async def transcribe_audio(self, audio_path):
+        self.transcriptions += 1
+        return {"text": TRANSCRIPT, "confidence": 0.9, "processing_time": 0.01, "language": "en"}
+    
+    async def synthesize_speech(self, text, voice, language, conditioning=None, speed=1.0):
+        path = self.output_dir / f"speech_{len(list(self.output_dir.iterdir()))}.wav"
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(self.sample_rate)
+            f.writeframes(SENTENCE_PCM)
+        return str(path)
+    
+    async def prepare_voice(self, voice):
+        return {"voice": voice}
+    
+    async def stream_transcribe(self, audio):
+        async for _ in audio:
+            pass
+        yield TRANSCRIPT
+    
+    async def synthesize_speech_chunk(self, text, voice, language, conditioning=None):
+        return SENTENCE_PCM
+
+class FakeConversationEngine:
+    """Conversation backend replying with canned tokens."""
+    
+    async def process_conversation(self, message, context, user_id, conversation_id=None):
+        return {
+            "response": "".join(REPLY_TOKENS),
+            "context": context,
+            "conversation_id": conversation_id or "conversation-1",
+            "processing_time": 0.01
+        }
+    
+    async def stream_process_conversation(self, message_stream, context, user_id):
+        async for _ in message_stream:
+            pass
+        for token in REPLY_TOKENS:
+            yield token
+
+def _backend_stand_ins() -> Dict[str, types.ModuleType]:
+    """Modules app.py imports from backend packages that are not in this tree."""
+    class Backend:
+        def __init__(self, settings):
+            self.settings = settings
+    
+    class VoiceRequest(BaseModel):
+        text: str
+        voice: Optional[str] = None
+        language: Optional[str] = None
+        speed: Optional[float] = None
+    
+    class VoiceResponse(BaseModel):
+        text: str
+        confidence: float
+        processing_time: float
+        language: str
+    
+    class ConversationRequest(BaseModel):
+        message: str
+        context: Dict[str, Any] = {}
+        user_id: str = "anonymous"
+        conversation_id: Optional[str] = None
+    
+    class ConversationResponse(BaseModel):
+        response: str
+        context: Dict[str, Any]
+        conversation_id: str
+        confidence: float
+        processing_time: float
+    
+    attributes = {
+        "src.audio.speech_processor": {"SpeechProcessor": Backend},
+        "src.ai.conversation_engine": {"ConversationEngine": Backend},
+        "src.database.models": {
+            "UsageAnalytics": type("UsageAnalytics", (), {}),
+            "ConversationLog": type("ConversationLog", (), {})
+        },
+        "src.api.models": {
+            "VoiceRequest": VoiceRequest,
+            "VoiceResponse": VoiceResponse,
+            "ConversationRequest": ConversationRequest,
+            "ConversationResponse": ConversationResponse
+        },
+    }
+    
+    modules = {}
+    for name, attrs in attributes.items():
+        try:
+            if importlib.util.find_spec(name) is not None:
+                continue
+        except ModuleNotFoundError:
+            pass
+        package = name.rpartition(".")[0]
+        if package not in sys.modules:
+            try:
+                importlib.import_module(package)
+            except ModuleNotFoundError:
+                modules[package] = types.ModuleType(package)
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        modules[name] = module
+    return modules
+
+@pytest.fixture(scope="session")
+def app_module(tmp_path_factory):
+    """The app module, imported with its working directories in a temp dir.
+    
+    Backend packages that are not part of this tree are replaced by bare
+    stand-ins; tests swap in fake backends through the voice_client fixture.
+    """
+    pytest.importorskip("sqlalchemy")
+    pytest.importorskip("aiofiles")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("app"))
+        for name, module in _backend_stand_ins().items():
+            mp.setitem(sys.modules, name, module)
+        import app
+        yield app
+
+@pytest.fixture
+def voice_client(app_module, monkeypatch, tmp_path):
+    """Test client for the app with fake speech and conversation backends.
+    
+    Startup hooks are not run; the state the endpoints rely on is set here.
+    """
+    settings = app_module.settings
+    monkeypatch.setattr(app_module, "speech_processor", FakeSpeechProcessor(tmp_path, settings.SAMPLE_RATE))
+    monkeypatch.setattr(app_module, "conversation_engine", FakeConversationEngine())
+    monkeypatch.setattr(app_module, "_voice_conditioning_cache", OrderedDict())
+    monkeypatch.setattr(app_module, "_transcription_cache", OrderedDict())
+    monkeypatch.setattr(app_module.app.state, "analytics_queue", asyncio.Queue(), raising=False)
+    monkeypatch.setattr(app_module.app.state, "cleanup_heap", [], raising=False)
+    monkeypatch.setattr(app_module.app.state, "cleanup_event", asyncio.Event(), raising=False)
+    return TestClient(app_module.app)
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client for the app; startup and shutdown run once per session."""
+    from main import app
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture(scope="session")
+def clone_response():
+    """Canned ElevenLabs voice clone response."""
+    return json.loads((FIXTURES_DIR / "clone_response.json").read_text())
+
+@pytest.fixture(scope="session")
+def mock_elevenlabs_clone(clone_response):
+    """ElevenLabs voice clone stand-in returning a ready voice."""
+    return Mock(return_value=clone_response)
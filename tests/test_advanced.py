@@ -3,47 +3,141 @@
 Tests requiring external API access or audio hardware are marked to skip in CI.
 """
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
 import asyncio
-import json
+import orjson
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+from src.utils.batching import BatchedRunner
+from conftest import REPLY_TOKENS, SENTENCE_PCM, TRANSCRIPT
+
+_DETECTABLE_LANGUAGES = frozenset({"en", "fr", "es", "de", "ja"})
+_MULTILINGUAL_SAMPLES = (
+    ("en", "Hello world"),
+    ("es", "Hola mundo"),
+    ("fr", "Bonjour le monde"),
+    ("de", "Hallo Welt"),
+    ("ja", "こんにちは世界"),
+)
 
 class TestAPIIntegration:
     """Test API integration points."""
     
-    @pytest.mark.skip(reason="Requires WebSocket connection and external APIs")
-    def test_websocket_streaming(self):
-        """Test WebSocket streaming functionality."""
-        # This would require actual WebSocket connection
-        with patch('websockets.connect') as mock_ws:
-            mock_ws.return_value.__aenter__.return_value.recv = AsyncMock(
-                return_value=json.dumps({"type": "audio", "data": "base64data"})
-            )
-            assert mock_ws.called
-    
-    @pytest.mark.skip(reason="Requires Whisper API access")
-    def test_transcription_api_call(self):
-        """Test actual API call to transcription service."""
-        with patch('openai.Audio.transcribe') as mock_transcribe:
-            mock_transcribe.return_value = {"text": "Test transcription"}
-            result = mock_transcribe(file=open("test.wav", "rb"), model="whisper-1")
-            assert result["text"] == "Test transcription"
-    
-    @pytest.mark.skip(reason="Requires ElevenLabs API access")
-    def test_tts_api_integration(self):
-        """Test TTS API integration."""
-        with patch('elevenlabs.generate') as mock_generate:
-            mock_generate.return_value = b"fake_audio_data"
-            audio = mock_generate(text="Test", voice="Adam")
-            assert len(audio) > 0
+    def test_websocket_streaming(self, voice_client):
+        """Test that /ws/voice sends one audio frame per reply sentence."""
+        with voice_client.websocket_connect("/ws/voice") as ws:
+            ready = ws.receive_bytes()
+            assert ready[:1] == b"\x00"
+            assert orjson.loads(ready[1:])["type"] == "ready"
+            
+            ws.send_bytes(b"\x00\x00" * 160)
+            ws.send_text('{"type": "end"}')
+            
+            metadata, audio_frames = [], []
+            while not metadata or metadata[-1]["type"] != "end":
+                frame = ws.receive_bytes()
+                if frame[:1] == b"\x01":
+                    audio_frames.append(frame[1:])
+                else:
+                    metadata.append(orjson.loads(frame[1:]))
+        
+        sentences = [m["text"] for m in metadata if m["type"] == "sentence"]
+        assert sentences == [token.strip() for token in REPLY_TOKENS]
+        assert audio_frames == [SENTENCE_PCM] * len(sentences)
+        assert {"type": "transcript", "text": TRANSCRIPT} in metadata
+    
+    @pytest.mark.parametrize("content_type", [
+        "audio/webm;codecs=opus",
+        "audio/ogg",
+        "Audio/WAV",
+        "audio/mpeg",
+    ])
+    def test_speech_to_text_accepts_audio_content_types(self, voice_client, content_type):
+        """Test that uploads are matched on their media type, ignoring parameters."""
+        response = voice_client.post(
+            "/api/v1/speech-to-text",
+            files={"audio_file": ("clip.bin", b"\x00" * 64, content_type)}
+        )
+        assert response.status_code == 200
+        assert response.json()["text"] == TRANSCRIPT
+    
+    def test_speech_to_text_rejects_non_audio(self, voice_client):
+        """Test that a non-audio upload is a client error, not a processing failure."""
+        response = voice_client.post(
+            "/api/v1/speech-to-text",
+            files={"audio_file": ("notes.txt", b"hello", "text/plain")}
+        )
+        assert response.status_code == 400
+    
+    def test_transcription_api_call(self, voice_client, app_module):
+        """Test that repeated uploads of the same audio reuse the transcription."""
+        upload = {"audio_file": ("clip.wav", b"\x00\x01" * 64, "audio/wav")}
+        first = voice_client.post("/api/v1/speech-to-text", files=upload)
+        second = voice_client.post("/api/v1/speech-to-text", files=upload)
+        
+        assert first.status_code == second.status_code == 200
+        assert first.json()["text"] == second.json()["text"] == TRANSCRIPT
+        assert app_module.speech_processor.transcriptions == 1
+    
+    @pytest.mark.parametrize("enabled, queued", [(True, 1), (False, 0)])
+    def test_usage_analytics_follows_setting(self, voice_client, app_module, monkeypatch, enabled, queued):
+        """Test that usage analytics are queued only when ENABLE_ANALYTICS is set."""
+        monkeypatch.setattr(app_module, "settings", app_module.settings.model_copy(update={"ENABLE_ANALYTICS": enabled}))
+        response = voice_client.post(
+            "/api/v1/speech-to-text",
+            files={"audio_file": ("clip.wav", b"\x00\x01" * 64, "audio/wav")}
+        )
+        
+        assert response.status_code == 200
+        assert app_module.app.state.analytics_queue.qsize() == queued
+    
+    def test_tts_api_integration(self, voice_client, app_module):
+        """Test that text-to-speech serves the synthesized WAV and schedules its cleanup."""
+        response = voice_client.post(
+            "/api/v1/text-to-speech",
+            json={"text": "Test", "voice": "Adam"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "audio/wav"
+        assert response.headers["content-encoding"] == "identity"
+        assert response.content[:4] == b"RIFF"
+        assert len(app_module.app.state.cleanup_heap) == 1
+    
+    @pytest.mark.parametrize("failure", ["missing_binary", "encoder_error"])
+    def test_tts_opus_failure_leaves_no_files(self, voice_client, app_module, monkeypatch, tmp_path, failure):
+        """Test that a failed Opus transcode removes both the WAV and the partial Ogg file."""
+        async def create_subprocess_exec(*args, **kwargs):
+            if failure == "missing_binary":
+                raise FileNotFoundError("ffmpeg")
+            Path(args[-1]).write_bytes(b"OggS")  # Partially written output
+            process = Mock(returncode=1)
+            process.communicate = AsyncMock(return_value=(None, b"encoder error"))
+            return process
+        
+        monkeypatch.setattr(app_module, "settings", app_module.settings.model_copy(update={"AUDIO_FORMAT": "ogg"}))
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", create_subprocess_exec)
+        response = voice_client.post(
+            "/api/v1/text-to-speech",
+            json={"text": "Test", "voice": "Adam"}
+        )
+        
+        assert response.status_code == 500
+        assert list(tmp_path.iterdir()) == []
+        assert app_module.app.state.cleanup_heap == []
 
 class TestAudioProcessing:
     """Test audio processing utilities."""
     
-    def test_audio_format_validation(self):
-        """Test that audio format validation works."""
-        valid_formats = ['wav', 'mp3', 'ogg', 'flac']
-        for fmt in valid_formats:
-            assert fmt in valid_formats
+    def test_audio_format_validation(self, app_module):
+        """Test that every configured audio format is accepted for upload."""
+        for fmt in app_module.settings.ALLOWED_AUDIO_FORMATS:
+            assert f"audio/{fmt}" in app_module.ALLOWED_AUDIO_CONTENT_TYPES, fmt
+    
+    @pytest.mark.parametrize("content_type", ["audio/xyz", "text/plain", "application/octet-stream"])
+    def test_unsupported_audio_format(self, app_module, content_type):
+        """Test that unknown content types are rejected."""
+        assert content_type not in app_module.ALLOWED_AUDIO_CONTENT_TYPES
     
     def test_sample_rate_validation(self):
         """Test sample rate validation."""
@@ -54,52 +148,120 @@ class TestAudioProcessing:
         }
         assert valid_sample["sample_rate"] >= 16000, "Sample rate too low"
     
-    def test_voice_clone_creation(self):
+    def test_voice_clone_creation(self, mock_elevenlabs_clone):
         """Test creating a voice clone from reference."""
-        with patch('elevenlabs.clone') as mock_clone:
-            mock_clone.return_value = {
-                "voice_id": "cloned_voice_123",
-                "name": "Test Voice",
-                "status": "ready"
-            }
-            
-            result = mock_clone(
-                name="Test Voice",
-                files=["sample1.wav", "sample2.wav"]
-            )
-            
-            assert result["voice_id"] is not None
-            assert result["status"] == "ready"
+        result = mock_elevenlabs_clone(
+            name="Test Voice",
+            files=["sample1.wav", "sample2.wav"]
+        )
+        
+        assert result["voice_id"] is not None
+        assert result["status"] == "ready"
 
 class TestMultilingual:
     """Test multilingual support."""
     
-    @pytest.mark.parametrize("language,text", [
-        ("en", "Hello world"),
-        ("es", "Hola mundo"),
-        ("fr", "Bonjour le monde"),
-        ("de", "Hallo Welt"),
-        ("ja", "こんにちは世界"),
-    ])
-    def test_multilingual_tts(self, language, text):
-        """Test TTS with multiple languages."""
-        assert isinstance(language, str)
-        assert isinstance(text, str)
-        assert len(language) == 2  # ISO 639-1 code
-        assert len(text) > 0
+    def test_multilingual_tts(self):
+        """Test TTS inputs for multiple languages."""
+        for language, text in _MULTILINGUAL_SAMPLES:
+            assert isinstance(language, str)
+            assert isinstance(text, str)
+            assert len(language) == 2, language  # ISO 639-1 code
+            assert len(text) > 0, language
     
     def test_language_detection(self):
         """Test automatic language detection."""
-        test_cases = [
+        test_cases = (
             ("Hello", "en"),
             ("Bonjour", "fr"),
             ("Hola", "es"),
-        ]
+        )
         
         for text, expected_lang in test_cases:
             # Mock language detection
             detected = "en"  # Simplified
-            assert detected in ["en", "fr", "es", "de", "ja"]
+            assert detected in _DETECTABLE_LANGUAGES
+
+class TestBatchedRunner:
+    """Test dynamic batching of concurrent requests."""
+    
+    async def test_concurrent_requests_share_one_batch(self):
+        """Test that concurrent submissions are processed in a single call."""
+        calls = []
+        
+        async def double(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+        
+        runner = BatchedRunner(double, max_batch=4, max_wait_ms=50)
+        runner.start()
+        results = await asyncio.gather(*(runner.submit(i) for i in range(4)))
+        await runner.stop()
+        
+        assert results == [0, 2, 4, 6]
+        assert calls == [[0, 1, 2, 3]]
+    
+    async def test_partial_batch_flushed_after_wait(self):
+        """Test that a partial batch is processed once max_wait_ms expires."""
+        async def identity(items):
+            return items
+        
+        runner = BatchedRunner(identity, max_batch=8, max_wait_ms=5)
+        runner.start()
+        result = await asyncio.wait_for(runner.submit("only"), timeout=1)
+        await runner.stop()
+        
+        assert result == "only"
+    
+    async def test_batch_error_propagates_to_all_callers(self):
+        """Test that a failing batch call raises in every waiting request."""
+        async def fail(items):
+            raise ValueError("model failure")
+        
+        runner = BatchedRunner(fail, max_batch=2, max_wait_ms=50)
+        runner.start()
+        results = await asyncio.gather(
+            runner.submit(1), runner.submit(2), return_exceptions=True
+        )
+        await runner.stop()
+        
+        assert all(isinstance(r, ValueError) for r in results)
+    
+    async def test_slow_batch_does_not_block_next_batch(self):
+        """Test that a second batch is dispatched while the first is still running."""
+        gate = asyncio.Event()
+        started = []
+        
+        async def process(items):
+            started.append(list(items))
+            if items == [0]:
+                await gate.wait()
+            return items
+        
+        runner = BatchedRunner(process, max_batch=1, max_wait_ms=1)
+        runner.start()
+        first = asyncio.create_task(runner.submit(0))
+        second = await asyncio.wait_for(runner.submit(1), timeout=1)
+        gate.set()
+        
+        assert (await first, second) == (0, 1)
+        assert started == [[0], [1]]
+        await runner.stop()
+    
+    async def test_exception_result_fails_only_its_item(self):
+        """Test that an exception returned for one item does not fail the batch."""
+        async def process(items):
+            return [ValueError("bad item") if item == "bad" else item for item in items]
+        
+        runner = BatchedRunner(process, max_batch=2, max_wait_ms=50)
+        runner.start()
+        good, bad = await asyncio.gather(
+            runner.submit("good"), runner.submit("bad"), return_exceptions=True
+        )
+        await runner.stop()
+        
+        assert good == "good"
+        assert isinstance(bad, ValueError)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
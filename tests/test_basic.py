@@ -1,8 +1,11 @@
 """Basic health check tests for Voice-GenAI-Tool."""
+import importlib.util
 import pytest
 import sys
 from pathlib import Path
-from fastapi.testclient import TestClient
+
+_ROOT = Path(__file__).resolve().parent.parent
+_REQUIRED = {p: (_ROOT / p).exists() for p in ("README.md", "requirements.txt")}
 
 def test_python_version():
     """Test that Python version is 3.8 or higher."""
@@ -10,30 +13,19 @@ def test_python_version():
 
 def test_project_structure():
     """Test that essential project files exist."""
-    project_root = Path(__file__).parent.parent
-    assert (project_root / "README.md").exists(), "README.md should exist"
-    assert (project_root / "requirements.txt").exists(), "requirements.txt should exist"
+    for name, exists in _REQUIRED.items():
+        assert exists, f"{name} should exist"
 
 def test_imports():
-    """Test that key dependencies can be imported."""
-    try:
-        import speech_recognition
-        import pyttsx3
-        import openai
-        assert True
-    except ImportError as e:
-        pytest.fail(f"Failed to import required dependency: {e}")
+    """Test that key dependencies are installed, without importing them."""
+    for name in ("speech_recognition", "pyttsx3", "openai"):
+        assert importlib.util.find_spec(name) is not None, f"{name} not installed"
 
-def test_health_endpoint():
+def test_health_endpoint(client):
     """Test that /health endpoint exists and returns 200 OK."""
-    try:
-        from main import app
-        client = TestClient(app)
-        response = client.get("/health")
-        assert response.status_code == 200
-        assert "status" in response.json()
-    except ImportError as e:
-        pytest.fail(f"Failed to import main app: {e}")
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert "status" in response.json()
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])